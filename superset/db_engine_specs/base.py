@@ -2107,7 +2107,7 @@ class BasicParametersMixin:
 
         required = {"host", "port", "username", "database"}
         parameters = properties.get("parameters", {})
-        present = {key for key in parameters if parameters.get(key, ())}
+        present = {key for key, value in parameters.items() if value}
 
         if missing := sorted(required - present):
             errors.append(
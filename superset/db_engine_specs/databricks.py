@@ -287,7 +287,7 @@ class DatabricksNativeEngineSpec(DatabricksODBCEngineSpec, BasicParametersMixin)
         if connect_args.get("http_path"):
             parameters["http_path"] = connect_args.get("http_path")
 
-        present = {key for key in parameters if parameters.get(key, ())}
+        present = {key for key, value in parameters.items() if value}
 
         if missing := sorted(required - present):
             errors.append(
@@ -311,7 +311,7 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
             "password",
         }
         parameters = properties.get("parameters", {})
-        present = {key for key in parameters if parameters.get(key, ())}
+        present = {key for key, value in parameters.items() if value}
 
         if missing := sorted(required - present):
             errors.append(